@@ -31,6 +31,7 @@ if __name__ == "__main__":
     dates_to_remove = date_input_getter.get_multiple_inputs()
     if dates_to_remove is None:
         exit()
+    dates_to_remove = frozenset(dates_to_remove)
 
     printed_diary = printed_diary.except_dates(dates_to_remove)
     meal_diary = meal_diary.except_dates(dates_to_remove)
@@ -5,6 +5,8 @@ from mealprep.constants import BaseEnum, Category, Unit
 
 
 class Ingredient:
+    __slots__ = ("name", "category")
+
     def __init__(self, name: str, category: Category):
         if not isinstance(name, str):
             raise TypeError("'name' argument must be a string in Ingredient init")
@@ -16,6 +18,8 @@ class Ingredient:
 
 
 class IngredientQuantity:
+    __slots__ = ("ingredient", "unit", "quantity")
+
     def __init__(self, ingredient: Ingredient, unit: Unit, quantity: Any):
         if not isinstance(ingredient, Ingredients):
             raise TypeError(
@@ -33,6 +37,21 @@ class IngredientQuantity:
         self.unit = unit
         self.quantity = quantity
 
+    @classmethod
+    def _from_validated_fields(
+        cls, ingredient: Ingredient, unit: Unit, quantity: Any
+    ) -> "IngredientQuantity":
+        """
+        Construct an IngredientQuantity without the checks made in init, for
+        internal use where the fields are known to be valid already
+        """
+
+        ret = cls.__new__(cls)
+        ret.ingredient = ingredient
+        ret.unit = unit
+        ret.quantity = quantity
+        return ret
+
     def __add__(self, other: "IngredientQuantity") -> "IngredientQuantity":
         if not isinstance(other, IngredientQuantity):
             raise TypeError(
@@ -49,10 +68,15 @@ class IngredientQuantity:
                 "Error in IngredientQuantity.__add__: both operands must have the same unit field"
             )
 
+        # Both operands passed the checks in init, and share an ingredient and unit
         if self.unit is Unit.BOOL:
-            return IngredientQuantity(self.ingredient, Unit.BOOL, self.quantity or other.quantity)
+            return IngredientQuantity._from_validated_fields(
+                self.ingredient, Unit.BOOL, self.quantity or other.quantity
+            )
 
-        return IngredientQuantity(self.ingredient, self.unit, self.quantity + other.quantity)
+        return IngredientQuantity._from_validated_fields(
+            self.ingredient, self.unit, self.quantity + other.quantity
+        )
 
     def __eq__(self, other) -> bool:
         return all(
@@ -68,14 +92,19 @@ class IngredientQuantity:
 
 
 class IngredientQuantityCollection:
-    def __init__(self, ingredient_quantities: Iterable[IngredientQuantity]):
-        self.ingredient_quantities = tuple(x for x in ingredient_quantities)
+    __slots__ = ("ingredient_quantities",)
 
-        for x in self.ingredient_quantities:
+    def __init__(self, ingredient_quantities: Iterable[IngredientQuantity]):
+        # Validate while copying, rather than copying and then validating the copy
+        validated_ingredient_quantities = []
+        for x in ingredient_quantities:
             if not isinstance(x, IngredientQuantity):
                 raise TypeError(
                     f"{x} is not an IngredientQuantity in IngredientQuantityCollection init"
                 )
+            validated_ingredient_quantities.append(x)
+
+        self.ingredient_quantities = tuple(validated_ingredient_quantities)
 
     def __iter__(self):
         return BasicIterator(self.ingredient_quantities)
@@ -1,6 +1,7 @@
 import collections
 import copy
 import datetime as dt
+import heapq
 import json
 from pathlib import Path
 from typing import Any, Dict, Iterable, Optional, Tuple, Union
@@ -72,9 +73,12 @@ class Meal:
         return f'Meal(name="{self.name}")'
 
     def __getitem__(self, key: MealMetadata) -> Any:
-        if not isinstance(key, MealMetadata):
+        # metadata holds an entry for every MealMetadata member, computed once
+        # in init, so a missing key can only mean the key is of the wrong type
+        try:
+            return self.metadata[key]
+        except KeyError:
             raise TypeError("'key' must be a MealMetadata instance")
-        return self.metadata[key]
 
 
 class MealCollection:
@@ -189,6 +193,9 @@ class MealDiary:
     def __len__(self) -> int:
         return len(self.meal_diary)
 
+    def __contains__(self, date: dt.date) -> bool:
+        return date in self.meal_diary
+
     def to_file(self, file_path: Path):
         with open(file_path, "w+") as fp:
             json.dump(self.get_representation(), fp, indent=2)
@@ -232,11 +239,17 @@ class MealDiary:
         )
 
     def filter_by_time_delta(self, date: dt.date, time_delta: dt.timedelta) -> "MealDiary":
+        # Dates are a whole number of days apart, so comparing day ordinals
+        # against the whole days in time_delta is equivalent to comparing
+        # timedeltas, without building a timedelta per diary entry
+        reference_ordinal = date.toordinal()
+        max_days = time_delta.days
+
         return MealDiary(
             {
                 meal_date: meal
                 for meal_date, meal in self.items()
-                if abs(meal_date - date) <= time_delta
+                if abs(meal_date.toordinal() - reference_ordinal) <= max_days
             }
         )
 
@@ -274,12 +287,15 @@ class MealDiary:
         """
         Return a copy of the MealDiary with the specified dates removed
         (if present)
+
+        The dates to exclude are collected into a set before filtering, so
+        the cost is linear in the sizes of the diary and of the exclusions
         """
 
         if isinstance(dates_to_exclude, dt.date):
             dates_to_exclude = (dates_to_exclude,)
 
-        dates_to_exclude = set(x for x in dates_to_exclude)
+        dates_to_exclude = set(dates_to_exclude)
 
         if not all(isinstance(x, dt.date) for x in dates_to_exclude):
             raise TypeError("All passed dates must be datetime.dates")
@@ -293,11 +309,14 @@ class MealDiary:
         )
 
     def get_pretty_print_string(self) -> str:
-        include_date_number_spacing = any(x.day >= 10 for x in self.dates)
-        include_year = len(set(x.year for x in self.dates)) > 1
+        # dates builds a new tuple on each access, so only access it once
+        dates = self.dates
+
+        include_date_number_spacing = any(x.day >= 10 for x in dates)
+        include_year = len(set(x.year for x in dates)) > 1
 
         lines = []
-        for date in sorted(self.dates):
+        for date in sorted(dates):
             meal = self[date]
             date_str = get_pretty_print_date_string(date, include_date_number_spacing, include_year)
             lines.append(f"{date_str}: {meal.name}")
@@ -315,25 +334,22 @@ class MealDiary:
         today, and the 'max_printed_next_diary_entries' closest after today
         """
 
-        previous_dates = sorted([x for x in self.dates if x < dt.date.today()])
-        if previous_dates:
-            n_previous_dates_printed = min(len(previous_dates), max_printed_previous_diary_entries)
-            if n_previous_dates_printed > 0:
-                min_printed_date = previous_dates[-n_previous_dates_printed]
-            else:
-                min_printed_date = dt.date.today()
-        else:
-            min_printed_date = dt.date.today()
-
-        next_dates = sorted([x for x in self.dates if x >= dt.date.today()])
-        if next_dates:
-            n_next_dates_printed = min(len(next_dates), max_printed_next_diary_entries)
-            if n_next_dates_printed > 0:
-                max_printed_date = next_dates[n_next_dates_printed - 1]
-            else:
-                max_printed_date = dt.date.today()
-        else:
-            max_printed_date = None
+        today = dt.date.today()
+
+        # Partition the diary dates about today in a single pass
+        previous_dates, next_dates = [], []
+        for date in self.meal_diary:
+            (previous_dates if date < today else next_dates).append(date)
+
+        # Only the closest few dates either side of today are needed, so select
+        # them directly rather than sorting the whole diary
+        previous_dates = heapq.nlargest(max_printed_previous_diary_entries, previous_dates)
+        min_printed_date = previous_dates[-1] if previous_dates else today
+
+        # max_date is exclusive in filter_dates. If there are no dates on or
+        # after today, today is as good an upper bound as no bound at all
+        next_dates = heapq.nsmallest(max_printed_next_diary_entries, next_dates)
+        max_printed_date = next_dates[-1] if next_dates else today
 
         return self.filter_dates(min_date=min_printed_date, max_date=max_printed_date)
 
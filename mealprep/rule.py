@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 import copy
 import datetime as dt
-from typing import Iterable
+from typing import Callable, Iterable, List
 
 from mealprep.basic_iterator import BasicIterator
 from mealprep.constants import BaseEnum
@@ -18,25 +18,31 @@ class Rule(ABC):
     def __call__(
         self, meal_collection: MealCollection, date: dt.date, meal_diary: MealDiary
     ) -> MealCollection:
+        Rule.check_arguments(meal_collection, date, meal_diary)
+
+        meal_collection = meal_collection.copy()
+        ret = self.filter(meal_collection, date, meal_diary)
+
+        if not isinstance(ret, MealCollection):
+            raise TypeError(f"Rule returned a type {type(ret)} instead of a MealCollection")
+
+        return ret
+
+    @staticmethod
+    def check_arguments(
+        meal_collection: MealCollection, date: dt.date, meal_diary: MealDiary
+    ) -> None:
         if not isinstance(meal_collection, MealCollection):
             raise TypeError("'meal_collection' parameter must be a MealCollection")
 
         if not isinstance(meal_diary, MealDiary):
             raise TypeError(f"'meal_diary' parameter must be a MealDiary")
 
-        if date in meal_diary.dates:
+        if date in meal_diary:
             raise ValueError(
                 f"Rule was passed a date, {date.strftime('%Y-%m-%d')}, which is already in the passed MealDiary"
             )
 
-        meal_collection = meal_collection.copy()
-        ret = self.filter(meal_collection, date, meal_diary)
-
-        if not isinstance(ret, MealCollection):
-            raise TypeError(f"Rule returned a type {type(ret)} instead of a MealCollection")
-
-        return ret
-
     @staticmethod
     @abstractmethod
     def filter(
@@ -46,11 +52,40 @@ class Rule(ABC):
 
     @staticmethod
     def from_name(rule_name: str) -> "Rule":
-        for rule in Rules:
-            if rule.name.lower() == rule_name.lower():
-                return rule.value
+        try:
+            return rule_names_to_rule_map[rule_name.upper()]
+        except KeyError:
+            raise ValueError(f'Could not find the rule "{rule_name}"')
+
+
+class PredicateRule(Rule):
+    """
+    A PredicateRule accepts or rejects each Meal on its own, regardless of
+    which other Meals are in the MealCollection. Its predicate, computed once
+    per date and MealDiary, can then be combined with those of other
+    PredicateRules to filter a MealCollection in a single pass
 
-        raise ValueError(f'Could not find the rule "{rule_name}"')
+    A PredicateRule which only applies on some dates should say so through
+    is_active, so that it can be skipped entirely on other dates
+    """
+
+    def filter(
+        self, meal_collection: MealCollection, date: dt.date, meal_diary: MealDiary
+    ) -> MealCollection:
+        if not self.is_active(date):
+            return meal_collection
+
+        predicate = self.get_predicate(date, meal_diary)
+        return MealCollection(meal for meal in meal_collection if predicate(meal))
+
+    @staticmethod
+    @abstractmethod
+    def get_predicate(date: dt.date, meal_diary: MealDiary) -> Callable[[Meal], bool]:
+        raise NotImplementedError("A PredicateRule's get_predicate method must be implemented")
+
+    @staticmethod
+    def is_active(date: dt.date) -> bool:
+        return True
 
 
 class RuleCollection:
@@ -71,100 +106,117 @@ class RuleCollection:
     def __iter__(self) -> BasicIterator:
         return BasicIterator(self.rules)
 
+    @staticmethod
+    def apply_predicates(
+        meal_collection: MealCollection, predicates: List[Callable[[Meal], bool]]
+    ) -> MealCollection:
+        if not predicates:
+            return meal_collection
+
+        return MealCollection(
+            meal for meal in meal_collection if all(predicate(meal) for predicate in predicates)
+        )
+
     def __call__(
         self, meal_collection: MealCollection, date: dt.date, meal_diary: MealDiary
     ) -> MealCollection:
+        """
+        Apply each Rule in turn to the meal_collection
+
+        Consecutive PredicateRules are fused, so that their predicates are
+        applied together in one pass over the MealCollection rather than
+        building an intermediate MealCollection per Rule. PredicateRules
+        which are not active on the date are skipped
+        """
+
+        Rule.check_arguments(meal_collection, date, meal_diary)
+
         ret = meal_collection
+        predicates = []
         for rule in self:
+            if isinstance(rule, PredicateRule):
+                if rule.is_active(date):
+                    predicates.append(rule.get_predicate(date, meal_diary))
+                continue
+
+            ret = RuleCollection.apply_predicates(ret, predicates)
+            predicates = []
             ret = rule(ret, date, meal_diary)
-        return ret
+
+        return RuleCollection.apply_predicates(ret, predicates)
 
 
-class ForceRoastOnSunday(Rule):
+class ForceRoastOnSunday(PredicateRule):
     @staticmethod
-    def filter(
-        meal_collection: MealCollection, date: dt.date, meal_diary: MealDiary
-    ) -> MealCollection:
-        if date.weekday() != 6:
-            return meal_collection
+    def get_predicate(date: dt.date, meal_diary: MealDiary) -> Callable[[Meal], bool]:
+        return lambda meal: meal[MealTag.ROAST]
 
-        return MealCollection(meal for meal in meal_collection if meal[MealTag.ROAST])
+    @staticmethod
+    def is_active(date: dt.date) -> bool:
+        return date.weekday() == 6
 
 
-class NotIndianTwiceWithinTenDaysRule(Rule):
+class NotIndianTwiceWithinTenDaysRule(PredicateRule):
     @staticmethod
-    def filter(
-        meal_collection: MealCollection, date: dt.date, meal_diary: MealDiary
-    ) -> MealCollection:
+    def get_predicate(date: dt.date, meal_diary: MealDiary) -> Callable[[Meal], bool]:
         indian_within_ten_days = any(
             meal[MealTag.INDIAN]
             for meal in meal_diary.filter_by_time_delta(date, dt.timedelta(days=10)).meals
         )
 
         if not indian_within_ten_days:
-            return meal_collection
+            return lambda meal: True
 
-        return MealCollection(meal for meal in meal_collection if not meal[MealTag.INDIAN])
+        return lambda meal: not meal[MealTag.INDIAN]
 
 
-class NotPastaTwiceWithinFiveDaysRule(Rule):
+class NotPastaTwiceWithinFiveDaysRule(PredicateRule):
     @staticmethod
-    def filter(
-        meal_collection: MealCollection, date: dt.date, meal_diary: MealDiary
-    ) -> MealCollection:
+    def get_predicate(date: dt.date, meal_diary: MealDiary) -> Callable[[Meal], bool]:
         pasta_within_five_days = any(
             meal[MealTag.PASTA]
             for meal in meal_diary.filter_by_time_delta(date, dt.timedelta(days=5)).meals
         )
 
         if not pasta_within_five_days:
-            return meal_collection
+            return lambda meal: True
 
-        return MealCollection(meal for meal in meal_collection if not meal[MealTag.PASTA])
+        return lambda meal: not meal[MealTag.PASTA]
 
 
-class NotRoastOnNonSunday(Rule):
+class NotRoastOnNonSunday(PredicateRule):
     @staticmethod
-    def filter(
-        meal_collection: MealCollection, date: dt.date, meal_diary: MealDiary
-    ) -> MealCollection:
-        if date.weekday() == 6:
-            return meal_collection
+    def get_predicate(date: dt.date, meal_diary: MealDiary) -> Callable[[Meal], bool]:
+        return lambda meal: not meal[MealTag.ROAST]
 
-        return MealCollection(meal for meal in meal_collection if not meal[MealTag.ROAST])
+    @staticmethod
+    def is_active(date: dt.date) -> bool:
+        return date.weekday() != 6
 
 
-class NotSameMealWithinSevenDaysRule(Rule):
+class NotSameMealWithinSevenDaysRule(PredicateRule):
     @staticmethod
-    def filter(
-        meal_collection: MealCollection, date: dt.date, meal_diary: MealDiary
-    ) -> MealCollection:
-        meal_names_to_avoid = set(
+    def get_predicate(date: dt.date, meal_diary: MealDiary) -> Callable[[Meal], bool]:
+        meal_names_to_avoid = {
             meal.name for meal in meal_diary.filter_by_time_delta(date, dt.timedelta(days=7)).meals
-        )
+        }
 
-        return MealCollection(
-            meal for meal in meal_collection if meal.name not in meal_names_to_avoid
-        )
+        return lambda meal: meal.name not in meal_names_to_avoid
 
 
-class NotSameMeatOnConsecutiveDaysRule(Rule):
+class NotSameMeatOnConsecutiveDaysRule(PredicateRule):
     @staticmethod
-    def filter(
-        meal_collection: MealCollection, date: dt.date, meal_diary: MealDiary
-    ) -> MealCollection:
-        meats_to_avoid = set(
+    def get_predicate(date: dt.date, meal_diary: MealDiary) -> Callable[[Meal], bool]:
+        meats_to_avoid = {
             meal[MealProperty.MEAT]
             for meal in meal_diary.filter_by_time_delta(date, dt.timedelta(days=1)).meals
-            if meal[MealProperty.MEAT] is not MealMeat.NONE
-        )
+        }
+        meats_to_avoid.discard(MealMeat.NONE)
 
-        return MealCollection(
-            meal for meal in meal_collection if meal[MealProperty.MEAT] not in meats_to_avoid
-        )
+        return lambda meal: meal[MealProperty.MEAT] not in meats_to_avoid
 
 
-class NotSpecifiedMealOnSpecifiedDate(Rule):
+class NotSpecifiedMealOnSpecifiedDate(PredicateRule):
     def __init__(self, date: dt.date, meal_to_avoid: Meal):
         if not isinstance(date, dt.date):
             raise TypeError(
@@ -178,13 +230,11 @@ class NotSpecifiedMealOnSpecifiedDate(Rule):
         self.date = date
         self.meal_to_avoid = meal_to_avoid
 
-    def filter(
-        self, meal_collection: MealCollection, date: dt.date, meal_diary: MealDiary
-    ) -> MealCollection:
-        if date != self.date:
-            return meal_collection
+    def get_predicate(self, date: dt.date, meal_diary: MealDiary) -> Callable[[Meal], bool]:
+        return lambda meal: meal != self.meal_to_avoid
 
-        return MealCollection(meal for meal in meal_collection if meal != self.meal_to_avoid)
+    def is_active(self, date: dt.date) -> bool:
+        return date == self.date
 
 
 class Rules(BaseEnum):
@@ -194,3 +244,6 @@ class Rules(BaseEnum):
     NOT_ROAST_ON_NON_SUNDAY = NotRoastOnNonSunday()
     NOT_SAME_MEAL_WITHIN_SEVEN_DAYS = NotSameMealWithinSevenDaysRule()
     NOT_SAME_MEAT_ON_CONSECUTIVE_DAYS = NotSameMeatOnConsecutiveDaysRule()
+
+
+rule_names_to_rule_map = {x.name.upper(): x.value for x in Rules}
@@ -226,6 +226,10 @@ class TestMealDiary(unittest.TestCase):
         self.assertEqual(len(altered_diary), 4)
         self.assertIn(dt.date(2022, 2, 1), altered_diary.dates)
 
+    def test_contains(self):
+        self.assertIn(dt.date(2022, 1, 10), self.meal_diary)
+        self.assertNotIn(dt.date(2022, 1, 2), self.meal_diary)
+
     def test_loading_project_diary(self):
         project_diary = MealDiary.from_project_diary()
         self.assertIsInstance(project_diary, MealDiary)
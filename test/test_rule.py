@@ -2,7 +2,7 @@ import datetime as dt
 import unittest
 
 from mealprep.meal import Meal, MealCollection, MealDiary
-from mealprep.rule import NotSpecifiedMealOnSpecifiedDate, Rule, Rules
+from mealprep.rule import NotSpecifiedMealOnSpecifiedDate, Rule, RuleCollection, Rules
 
 
 class TrivialRule(Rule):
@@ -112,6 +112,9 @@ class TestRule(unittest.TestCase):
         self.assertEqual(sunday_collection, MealCollection((Meal.from_name("Roast Beef"),)))
         self.assertEqual(monday_collection, self.meal_collection)
 
+        self.assertTrue(force_roast_on_sunday_rule.is_active(self.sunday_date))
+        self.assertFalse(force_roast_on_sunday_rule.is_active(self.date))
+
     def test_not_pasta_twice_within_five_days_rule(self):
         not_pasta_twice_within_five_days_rule = Rules.NOT_PASTA_TWICE_WITHIN_FIVE_DAYS.value
 
@@ -177,3 +180,34 @@ class TestRule(unittest.TestCase):
 
         self.assertNotIn(chicken_fajitas_meal, filtered_collection)
         self.assertEqual(unfiltered_collection, self.meal_collection)
+
+    def test_from_name(self):
+        self.assertIs(
+            Rule.from_name("not_roast_on_non_sunday"), Rules.NOT_ROAST_ON_NON_SUNDAY.value
+        )
+        self.assertIs(Rule.from_name("FORCE_ROAST_ON_SUNDAY"), Rules.FORCE_ROAST_ON_SUNDAY.value)
+
+        with self.assertRaises(ValueError):
+            Rule.from_name("Not a rule")
+
+    def test_rule_collection(self):
+        rules = (
+            Rules.NOT_ROAST_ON_NON_SUNDAY.value,
+            Rules.NOT_PASTA_TWICE_WITHIN_FIVE_DAYS.value,
+            TrivialRule(),
+            Rules.NOT_SAME_MEAL_WITHIN_SEVEN_DAYS.value,
+        )
+        rule_collection = RuleCollection(rules)
+
+        for date in (dt.date(2022, 1, 4), self.date, self.sunday_date):
+            expected_collection = self.meal_collection
+            for rule in rules:
+                expected_collection = rule(expected_collection, date, self.meal_diary)
+
+            self.assertEqual(
+                rule_collection(self.meal_collection, date, self.meal_diary), expected_collection
+            )
+
+        # Fused rules should still check that the date is not already in the meal_diary
+        with self.assertRaises(ValueError):
+            rule_collection(self.meal_collection, self.meal_diary.dates[0], self.meal_diary)